@@ -94,20 +94,19 @@ class FAOMLForecaster:
             top_producers = food_by_country.head(5).index.tolist()
             
             for country in top_producers:
-                country_data = self.filtered_df[
+                country_rows = self.filtered_df.loc[
                     (self.filtered_df['Area'] == country) & 
-                    (self.filtered_df['Item'] == food)
-                ][['Year', 'Value']].sort_values('Year')
+                    (self.filtered_df['Item'] == food),
+                    ['Year', 'Value', 'Unit']
+                ]
+                country_data = country_rows[['Year', 'Value']].sort_values('Year')
                 
                 if len(country_data) >= 6 and country_data['Value'].sum() > 0:
                     scenarios.append({
                         'name': f'{country.lower().replace(" ", "_").replace("-", "_").replace("(", "").replace(")", "").replace(",", "").replace(".", "")}_{food.lower().replace(" ", "_").replace("-", "_").replace("(", "").replace(")", "").replace(",", "").replace(".", "")}',
                         'title': f'{food} Produktion in {country}',
                         'data': country_data,
-                        'unit': self.filtered_df[
-                            (self.filtered_df['Area'] == country) & 
-                            (self.filtered_df['Item'] == food)
-                        ]['Unit'].iloc[0],
+                        'unit': country_rows['Unit'].iat[0],
                         'type': 'country_production',
                         'total_production': float(country_data['Value'].sum())
                     })
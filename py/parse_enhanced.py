@@ -3,6 +3,7 @@ import json
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
 
 # ---------------------------------------------------------------------------
 # Sammel-Regionen, die in der App nicht benötigt werden und daher komplett
@@ -493,17 +494,15 @@ class EnhancedFAODataProcessor:
         print(f"✓ Einträge mit food_supply_kcal: {entries_with_kcal}/{len(data)}")
         print(f"✓ Gesamt food_supply_kcal Werte: {total_kcal_values}")
         
-        # Teste Sojabohnen
-        soy_entries = [e for e in data if 'soya' in e['item'].lower() and e['country'].lower() == 'world']
-        if soy_entries:
-            for entry in soy_entries[:2]:
-                item = entry['item']
-                data_2022 = [d for d in entry['data'] if d['year'] == 2022]
-                if data_2022:
-                    d = data_2022[0]
-                    kcal = d.get('food_supply_kcal', 'N/A')
-                    production = d.get('production', 'N/A')
-                    print(f"✓ {item} (World) 2022: {kcal} kcal/capita/day, {production} 1000t production")
+        # Teste Sojabohnen: lazy suchen und nach den ersten zwei World-Einträgen abbrechen
+        soy_entries = (e for e in data if e['country'].lower() == 'world' and 'soya' in e['item'].lower())
+        for entry in islice(soy_entries, 2):
+            item = entry['item']
+            d = next((d for d in entry['data'] if d['year'] == 2022), None)
+            if d is not None:
+                kcal = d.get('food_supply_kcal', 'N/A')
+                production = d.get('production', 'N/A')
+                print(f"✓ {item} (World) 2022: {kcal} kcal/capita/day, {production} 1000t production")
         
         return True
     
@@ -0,0 +1,93 @@
+"""
+Shared Timeseries Loader
+========================
+
+Loads public/data/fao/timeseries.json for the metrics test scripts.
+
+The parsed data is cached as a pickle in tests/.cache, keyed on the source file's
+modification time and size, so repeated runs (and the other test scripts) can skip
+JSON parsing entirely until timeseries.json changes. Within one process the loaded
+data is also memoized, so scripts run from the same interpreter share a single copy.
+"""
+
+import functools
+import json
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
+CACHE_DIR = Path(__file__).parent / ".cache"
+
+
+def _cache_key(timeseries_file: Path) -> Tuple[int, int]:
+    """Identify a version of the source file by (mtime_ns, size)"""
+    stat = timeseries_file.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_cache(cache_file: Path, key: Tuple[int, int]):
+    """Return the cached data if the cache header matches key, otherwise None"""
+    try:
+        with open(cache_file, 'rb') as f:
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+
+def _write_cache(cache_file: Path, key: Tuple[int, int], data: List[Dict]):
+    """Write the cache atomically so concurrent test runs never see a partial file"""
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(key, f, protocol=5)
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"⚠️  Could not write timeseries cache: {e}")
+
+
+def _parse_json(timeseries_file: Path) -> List[Dict]:
+    """Parse the JSON file, with orjson reading straight from a read-only memory map"""
+    with open(timeseries_file, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        if os.fstat(f.fileno()).st_size == 0:  # Empty files cannot be mapped
+            return orjson.loads(b"")
+        # orjson needs a buffer, so parse through a memoryview of the mapping
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def load_timeseries(timeseries_file: Path) -> List[Dict]:
+    """Load timeseries entries, preferring the pickle cache when it is up to date
+    
+    The returned list is shared between callers in the same process and must not be
+    modified.
+    """
+    timeseries_file = Path(timeseries_file)
+    return _load_timeseries(timeseries_file, _cache_key(timeseries_file))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_timeseries(timeseries_file: Path, key: Tuple[int, int]) -> List[Dict]:
+    """Memoized loader; key is part of the arguments so a changed file is reloaded"""
+    cache_file = CACHE_DIR / f"{timeseries_file.name}.cache.pkl"
+
+    data = _read_cache(cache_file, key)
+    if data is not None:
+        return data
+
+    data = _parse_json(timeseries_file)
+
+    _write_cache(cache_file, key, data)
+    return data
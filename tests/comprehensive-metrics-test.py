@@ -14,17 +14,33 @@ Test Coverage:
 - Validates metric mappings between UI and data
 - Analyzes data completeness and coverage
 - Provides detailed reporting on issues found
+
+Only warnings and errors are printed by default; set METRICS_TEST_VERBOSE=1 to also
+print the INFO details of every check.
 """
 
-import json
 import csv
 import sys
 import os
-from collections import defaultdict, Counter
-from typing import Dict, List, Set, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Any, Optional, Tuple, Callable, Union
 from dataclasses import dataclass
+from fnmatch import fnmatch
 from pathlib import Path
 
+from _ts_loader import load_timeseries
+
+try:
+    import orjson
+except ImportError:  # json.loads accepts bytes as well, just more slowly
+    import json as orjson
+
+try:
+    import ijson
+except ImportError:  # Standalone consistency checks fall back to a full load
+    ijson = None
+
 @dataclass
 class MetricInfo:
     """Information about a metric including its availability and mapping"""
@@ -43,11 +59,33 @@ class MetricInfo:
         if self.issues is None:
             self.issues = []
 
+def _compile_key_check(expected_keys: Tuple[str, ...]) -> Callable[[Any], List[str]]:
+    """Generate a function returning the expected keys missing from a mapping
+    
+    The checks are unrolled into one inline 'in' test per key, so validating an entry
+    allocates nothing unless a key is actually missing.
+    """
+    lines = ["def check(entry):", "    missing = []"]
+    for key in expected_keys:
+        lines.append(f"    if {key!r} not in entry: missing.append({key!r})")
+    lines.append("    return missing")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['check']
+
 class MetricsTestSuite:
     """Comprehensive test suite for metrics validation"""
     
-    def __init__(self, project_root: str):
+    EXPECTED_TOP_LEVEL_KEYS = ('country', 'item', 'unit', 'data')
+    
+    def __init__(self, project_root: str, verbose: Optional[bool] = None):
         self.project_root = Path(project_root)
+        
+        # INFO messages are only printed in verbose mode (METRICS_TEST_VERBOSE=1)
+        if verbose is None:
+            verbose = os.environ.get('METRICS_TEST_VERBOSE') == '1'
+        self.verbose = verbose
         self.public_data_dir = self.project_root / "public" / "data"
         self.fao_data_dir = self.public_data_dir / "fao"
         
@@ -128,8 +166,48 @@ class MetricsTestSuite:
             'issues': []
         }
         
-    def log_issue(self, level: str, message: str, details: str = None):
-        """Log an issue with the test"""
+        # Aggregates filled by _single_pass over the timeseries entries
+        self.total_data_points = 0
+        self.field_counts = Counter()
+        self.field_stats = {}
+        self.sample_calculations = []
+        self.consistency_issues = None  # None until the data has been checked
+        
+        # Directory listings, scanned once per directory
+        self._dir_cache = {}
+        
+        self._missing_entry_keys = _compile_key_check(self.EXPECTED_TOP_LEVEL_KEYS)
+        
+        # Reverse mapping from data field to the UI metric that displays it
+        self._field_to_metric = {m.data_field: name for name, m in self.ui_metrics.items() if m.data_field}
+        
+    def _dir_entries(self, directory: Path) -> Set[str]:
+        """Return the file names in a directory, listing it only on first use"""
+        if directory not in self._dir_cache:
+            try:
+                with os.scandir(directory) as it:
+                    self._dir_cache[directory] = {entry.name for entry in it}
+            except OSError:
+                self._dir_cache[directory] = set()
+        return self._dir_cache[directory]
+
+    def _exists(self, file_path: Path) -> bool:
+        """Check whether a path exists using the cached listing of its parent directory"""
+        return file_path.name in self._dir_entries(file_path.parent)
+
+    def log_issue(self, level: str, message: Union[str, Callable[[], str]], details: str = None):
+        """Log an issue with the test
+        
+        INFO results are counted as passed but only recorded and printed in verbose mode.
+        message may be a callable so expensive messages are only formatted when emitted.
+        """
+        if level == 'INFO' and not self.verbose:
+            self.test_results['passed'] += 1
+            return
+            
+        if callable(message):
+            message = message()
+            
         issue = {
             'level': level,
             'message': message,
@@ -160,7 +238,7 @@ class MetricsTestSuite:
         
         all_exist = True
         for file_path in required_files:
-            if file_path.exists():
+            if self._exists(file_path):
                 self.log_issue('INFO', f"✓ Found required file: {file_path.name}")
             else:
                 self.log_issue('ERROR', f"✗ Missing required file: {file_path}")
@@ -169,46 +247,47 @@ class MetricsTestSuite:
         return all_exist
 
     def load_timeseries_data(self) -> Optional[List[Dict]]:
-        """Load and parse timeseries data"""
+        """Load timeseries entries, using the shared pickle cache when it is current"""
         print("\n=== Loading Timeseries Data ===")
         
         timeseries_file = self.fao_data_dir / "timeseries.json"
-        if not timeseries_file.exists():
+        if not self._exists(timeseries_file):
             self.log_issue('ERROR', f"Timeseries file not found: {timeseries_file}")
             return None
             
         try:
-            with open(timeseries_file, 'r') as f:
-                data = json.load(f)
-            
-            self.log_issue('INFO', f"✓ Loaded timeseries data with {len(data)} entries")
-            
-            # Analyze structure
-            if data and len(data) > 0:
-                sample_entry = data[0]
-                self.log_issue('INFO', f"Sample entry structure: {list(sample_entry.keys())}")
-                if 'data' in sample_entry and sample_entry['data']:
-                    sample_year_data = sample_entry['data'][0]
-                    self.log_issue('INFO', f"Sample year data fields: {list(sample_year_data.keys())}")
-            
-            return data
-            
+            data = load_timeseries(timeseries_file)
         except Exception as e:
             self.log_issue('ERROR', f"Failed to load timeseries data: {e}")
             return None
+            
+        if not data:
+            self.log_issue('ERROR', "Timeseries data contains no entries")
+            return None
+            
+        self.log_issue('INFO', f"✓ Loaded timeseries data with {len(data)} entries")
+        
+        # Analyze structure
+        sample_entry = data[0]
+        self.log_issue('INFO', f"Sample entry structure: {list(sample_entry.keys())}")
+        if 'data' in sample_entry and sample_entry['data']:
+            sample_year_data = sample_entry['data'][0]
+            self.log_issue('INFO', f"Sample year data fields: {list(sample_year_data.keys())}")
+        
+        return data
 
     def load_metadata(self) -> Optional[Dict]:
         """Load and parse metadata"""
         print("\n=== Loading Metadata ===")
         
         metadata_file = self.fao_data_dir / "metadata.json"
-        if not metadata_file.exists():
+        if not self._exists(metadata_file):
             self.log_issue('ERROR', f"Metadata file not found: {metadata_file}")
             return None
             
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            with open(metadata_file, 'rb') as f:
+                metadata = orjson.loads(f.read())
                 
             self.log_issue('INFO', f"✓ Loaded metadata generated at: {metadata.get('generated_at', 'Unknown')}")
             
@@ -216,7 +295,7 @@ class MetricsTestSuite:
             if 'data_summary' in metadata:
                 summary = metadata['data_summary']
                 self.log_issue('INFO', f"Total records: {summary.get('total_records', 'Unknown')}")
-                self.log_issue('INFO', f"Years: {len(summary.get('years', []))} ({min(summary.get('years', []))} - {max(summary.get('years', []))})")
+                self.log_issue('INFO', lambda: f"Years: {len(summary.get('years', []))} ({min(summary.get('years', []))} - {max(summary.get('years', []))})")
                 self.log_issue('INFO', f"Countries: {len(summary.get('countries', []))}")
                 self.log_issue('INFO', f"Food items: {len(summary.get('food_items', []))}")
                 self.log_issue('INFO', f"Elements: {summary.get('elements', [])}")
@@ -227,49 +306,131 @@ class MetricsTestSuite:
             self.log_issue('ERROR', f"Failed to load metadata: {e}")
             return None
 
-    def analyze_data_fields(self, timeseries_data: List[Dict]) -> Set[str]:
-        """Analyze what data fields are actually available in the timeseries data"""
-        print("\n=== Analyzing Available Data Fields ===")
-        
-        all_fields = set()
+    def _single_pass(self, timeseries_data: List[Dict]):
+        """Collect every aggregate the analysis tests report on in one walk over the records
+        
+        Keys are counted per record with Counter.update, which runs in C. A record is only
+        looked at field by field when it holds a null, or while sample values for the UI
+        metric fields and feed_percentage samples are still being collected. Structure is
+        checked on the first 100 entries.
+        """
         field_counts = Counter()
+        null_counts = Counter()
+        total_data_points = 0
+        
+        # Sample values are only reported for fields a UI metric maps to
+        samples = {field: [] for field in self._field_to_metric}
+        pending = set(samples)
+        sample_calculations = []
+        
+        for i, entry in enumerate(timeseries_data):
+            year_entries = entry.get('data')
+            if not isinstance(year_entries, list):
+                continue
+            total_data_points += len(year_entries)
+            
+            # Sample feed_percentage from the first 10 entries
+            sample_feed = i < 10 and len(sample_calculations) < 5
+            
+            for year_data in year_entries:
+                if not isinstance(year_data, dict):
+                    continue
+                    
+                field_counts.update(year_data.keys())
+                if None in year_data.values():
+                    null_counts.update(field for field, value in year_data.items() if value is None)
+                    
+                if pending and not pending.isdisjoint(year_data):
+                    for field in pending.intersection(year_data):
+                        value = year_data[field]
+                        if isinstance(value, (int, float)):
+                            values = samples[field]
+                            values.append(float(value))
+                            if len(values) == 10:
+                                pending.discard(field)
+                                
+                if sample_feed:
+                    production = year_data.get('production')
+                    feed = year_data.get('feed')
+                    if isinstance(production, (int, float)) and isinstance(feed, (int, float)) and production > 0:
+                        sample_calculations.append({
+                            'country': entry.get('country'),
+                            'item': entry.get('item'),
+                            'year': year_data.get('year'),
+                            'production': production,
+                            'feed': feed,
+                            'feed_percentage': (feed / production) * 100
+                        })
+                        sample_feed = len(sample_calculations) < 5
+        
+        del field_counts['year']
+        field_stats = {
+            field: {'count': count - null_counts[field], 'values': samples.get(field, [])}
+            for field, count in field_counts.items()
+        }
+        
+        consistency_issues = []
         
-        for entry in timeseries_data:
-            if 'data' in entry:
-                for year_data in entry['data']:
-                    for field in year_data.keys():
-                        if field != 'year':  # Exclude year field
-                            all_fields.add(field)
-                            field_counts[field] += 1
+        # Test structure consistency
+        for i, entry in enumerate(timeseries_data[:100]):  # Test first 100 entries
+            missing_keys = self._missing_entry_keys(entry)
+            if missing_keys:
+                consistency_issues.append(f"Entry {i}: Missing keys {set(missing_keys)}")
+                
+            year_entries = entry.get('data')
+            if not isinstance(year_entries, list):
+                continue
+                
+            for j, year_data in enumerate(year_entries):
+                if not isinstance(year_data, dict):
+                    consistency_issues.append(f"Entry {i}, year {j}: Year data is not a dictionary")
+                    continue
+                    
+                if 'year' not in year_data:
+                    consistency_issues.append(f"Entry {i}, year {j}: Missing 'year' field")
+                    
+                # Check for reasonable year values
+                year = year_data.get('year')
+                if isinstance(year, int) and (year < 2000 or year > 2030):
+                    consistency_issues.append(f"Entry {i}, year {j}: Suspicious year value {year}")
+        
+        self.total_data_points = total_data_points
+        self.field_counts = field_counts
+        self.field_stats = field_stats
+        self.sample_calculations = sample_calculations
+        self.consistency_issues = consistency_issues
+
+    def analyze_data_fields(self) -> Set[str]:
+        """Analyze what data fields are actually available in the timeseries data"""
+        print("\n=== Analyzing Available Data Fields ===")
         
-        total_data_points = sum(len(entry.get('data', [])) for entry in timeseries_data)
+        field_counts = self.field_counts
+        total_data_points = self.total_data_points
+        all_fields = set(field_counts)
         
         print(f"Found {len(all_fields)} unique data fields across {total_data_points} data points:")
         for field in sorted(all_fields):
-            coverage = (field_counts[field] / total_data_points) * 100 if total_data_points > 0 else 0
-            self.log_issue('INFO', f"  {field}: {field_counts[field]} occurrences ({coverage:.1f}% coverage)")
+            self.log_issue('INFO', lambda: f"  {field}: {field_counts[field]} occurrences ({(field_counts[field] / total_data_points) * 100 if total_data_points > 0 else 0:.1f}% coverage)")
             
         return all_fields
 
-    def test_metric_data_availability(self, timeseries_data: List[Dict], available_fields: Set[str]) -> Dict[str, MetricInfo]:
+    def test_metric_data_availability(self, available_fields: Set[str]) -> Dict[str, MetricInfo]:
         """Test which metrics have data available"""
         print("\n=== Testing Metric Data Availability ===")
         
-        field_stats = defaultdict(lambda: {'count': 0, 'values': []})
+        field_stats = self.field_stats
+        total_possible_data_points = self.total_data_points
         
-        # Collect statistics for each field
-        for entry in timeseries_data:
-            if 'data' in entry:
-                for year_data in entry['data']:
-                    for field_name, value in year_data.items():
-                        if field_name != 'year' and value is not None:
-                            field_stats[field_name]['count'] += 1
-                            if isinstance(value, (int, float)) and len(field_stats[field_name]['values']) < 10:
-                                field_stats[field_name]['values'].append(float(value))
-        
-        total_possible_data_points = sum(len(entry.get('data', [])) for entry in timeseries_data)
+        # Assign collected statistics to the metrics that display each field
+        for field, stats in field_stats.items():
+            metric_name = self._field_to_metric.get(field)
+            if metric_name and field in available_fields:
+                metric_info = self.ui_metrics[metric_name]
+                metric_info.available_in_data = True
+                metric_info.sample_values = stats['values']
+                metric_info.coverage_percentage = (stats['count'] / total_possible_data_points) * 100 if total_possible_data_points > 0 else 0
         
-        # Update metric info with availability data
+        # Report availability per metric
         for metric_name, metric_info in self.ui_metrics.items():
             data_field = metric_info.data_field
             
@@ -283,15 +444,10 @@ class MetricsTestSuite:
                     metric_info.available_in_data = False
                     metric_info.issues.append("No data field mapping defined")
                     self.log_issue('WARNING', f"⚠ {metric_name} ({metric_info.ui_label}): No data field mapping")
-            elif data_field in available_fields:
-                stats = field_stats[data_field]
-                metric_info.available_in_data = True
-                metric_info.sample_values = stats['values']
-                metric_info.coverage_percentage = (stats['count'] / total_possible_data_points) * 100 if total_possible_data_points > 0 else 0
-                
+            elif metric_info.available_in_data:
                 self.log_issue('INFO', f"✓ {metric_name} ({metric_info.ui_label}): Available ({metric_info.coverage_percentage:.1f}% coverage)")
                 if metric_info.sample_values:
-                    self.log_issue('INFO', f"  Sample values: {metric_info.sample_values[:5]}")
+                    self.log_issue('INFO', lambda: f"  Sample values: {metric_info.sample_values[:5]}")
             else:
                 metric_info.available_in_data = False
                 metric_info.issues.append(f"Data field '{data_field}' not found in timeseries data")
@@ -299,77 +455,95 @@ class MetricsTestSuite:
                 
         return self.ui_metrics
 
-    def test_metric_calculations(self, timeseries_data: List[Dict]) -> bool:
+    def test_metric_calculations(self) -> bool:
         """Test calculated metrics like feed_percentage"""
         print("\n=== Testing Calculated Metrics ===")
         
         # Test feed_percentage calculation
-        feed_percentage_testable = False
-        sample_calculations = []
-        
-        for entry in timeseries_data[:10]:  # Test first 10 entries
-            if 'data' in entry:
-                for year_data in entry['data']:
-                    production = year_data.get('production')
-                    feed = year_data.get('feed')
-                    
-                    if production is not None and feed is not None and production > 0:
-                        feed_percentage = (feed / production) * 100
-                        sample_calculations.append({
-                            'country': entry.get('country'),
-                            'item': entry.get('item'),
-                            'year': year_data.get('year'),
-                            'production': production,
-                            'feed': feed,
-                            'feed_percentage': feed_percentage
-                        })
-                        feed_percentage_testable = True
-                        
-                        if len(sample_calculations) >= 5:
-                            break
-            if len(sample_calculations) >= 5:
-                break
+        sample_calculations = self.sample_calculations
+        feed_percentage_testable = bool(sample_calculations)
         
         if feed_percentage_testable:
             self.log_issue('INFO', f"✓ feed_percentage calculation test passed")
             for calc in sample_calculations:
-                self.log_issue('INFO', f"  {calc['country']} - {calc['item']} ({calc['year']}): {calc['feed']}/{calc['production']} = {calc['feed_percentage']:.1f}%")
+                self.log_issue('INFO', lambda: f"  {calc['country']} - {calc['item']} ({calc['year']}): {calc['feed']}/{calc['production']} = {calc['feed_percentage']:.1f}%")
         else:
             self.log_issue('WARNING', f"⚠ Could not test feed_percentage calculation - insufficient data")
             
         return feed_percentage_testable
 
-    def test_data_consistency(self, timeseries_data: List[Dict]) -> bool:
-        """Test data consistency and structure"""
-        print("\n=== Testing Data Consistency ===")
+    def _stream_consistency_issues(self, timeseries_file: Path) -> List[str]:
+        """Check the structure of the first 100 entries from ijson parse events
         
+        Only key names and year values are inspected, so no entry dicts are built.
+        """
         issues_found = []
+        entry_keys = set()
+        entry_start = 0
+        has_year = False
+        i = j = -1
+        
+        with open(timeseries_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix == 'item':
+                    if event == 'start_map':
+                        i += 1
+                        if i >= 100:  # Test first 100 entries
+                            break
+                        entry_keys = set()
+                        entry_start = len(issues_found)
+                        j = -1
+                    elif event == 'map_key':
+                        entry_keys.add(value)
+                    elif event == 'end_map':
+                        # Keys are only known at the end of the entry; report them ahead of
+                        # its year issues, in the same order as _single_pass
+                        missing_keys = self._missing_entry_keys(entry_keys)
+                        if missing_keys:
+                            issues_found.insert(entry_start, f"Entry {i}: Missing keys {set(missing_keys)}")
+                elif prefix == 'item.data.item':
+                    if event == 'start_map':
+                        j += 1
+                        has_year = False
+                    elif event == 'map_key':
+                        has_year = has_year or value == 'year'
+                    elif event == 'end_map':
+                        if not has_year:
+                            issues_found.append(f"Entry {i}, year {j}: Missing 'year' field")
+                    elif event != 'end_array':
+                        j += 1
+                        issues_found.append(f"Entry {i}, year {j}: Year data is not a dictionary")
+                elif prefix == 'item.data.item.year' and event == 'number':
+                    # Check for reasonable year values
+                    if isinstance(value, int) and (value < 2000 or value > 2030):
+                        issues_found.append(f"Entry {i}, year {j}: Suspicious year value {value}")
+                        
+        return issues_found
+
+    def test_data_consistency(self) -> bool:
+        """Test data consistency and structure
         
-        # Test structure consistency
-        expected_top_level_keys = {'country', 'item', 'unit', 'data'}
-        expected_year_keys = {'year'}
+        Reports the issues found by _single_pass. When called standalone, the file is
+        validated directly from the ijson event stream instead.
+        """
+        print("\n=== Testing Data Consistency ===")
         
-        for i, entry in enumerate(timeseries_data[:100]):  # Test first 100 entries
-            # Check top-level structure
-            entry_keys = set(entry.keys())
-            missing_keys = expected_top_level_keys - entry_keys
-            if missing_keys:
-                issues_found.append(f"Entry {i}: Missing keys {missing_keys}")
+        if self.consistency_issues is None:
+            timeseries_file = self.fao_data_dir / "timeseries.json"
+            if not self._exists(timeseries_file):
+                self.log_issue('ERROR', f"Timeseries file not found: {timeseries_file}")
+                return False
                 
-            # Check year data structure
-            if 'data' in entry and isinstance(entry['data'], list):
-                for j, year_data in enumerate(entry['data']):
-                    if not isinstance(year_data, dict):
-                        issues_found.append(f"Entry {i}, year {j}: Year data is not a dictionary")
-                        continue
-                        
-                    if 'year' not in year_data:
-                        issues_found.append(f"Entry {i}, year {j}: Missing 'year' field")
-                        
-                    # Check for reasonable year values
-                    year = year_data.get('year')
-                    if isinstance(year, int) and (year < 2000 or year > 2030):
-                        issues_found.append(f"Entry {i}, year {j}: Suspicious year value {year}")
+            try:
+                if ijson is not None:
+                    self.consistency_issues = self._stream_consistency_issues(timeseries_file)
+                else:
+                    self._single_pass(load_timeseries(timeseries_file))
+            except Exception as e:
+                self.log_issue('ERROR', f"Failed to load timeseries data: {e}")
+                return False
+
+        issues_found = self.consistency_issues
         
         if issues_found:
             for issue in issues_found[:10]:  # Show first 10 issues
@@ -381,16 +555,45 @@ class MetricsTestSuite:
             
         return len(issues_found) == 0
 
+    def _validate_production_file(self, production_file: Path) -> Tuple[Path, Optional[Tuple[str, Dict]], Set[str], Optional[str]]:
+        """Check that every country record in a production file has the expected keys
+        
+        Returns (path, first record, missing keys, error message).
+        """
+        expected_keys = {'value', 'unit', 'item', 'year', 'element'}
+        try:
+            with open(production_file, 'rb') as f:
+                production_data = orjson.loads(f.read())
+        except Exception as e:
+            return production_file, None, set(), str(e)
+            
+        if not isinstance(production_data, dict):
+            return production_file, None, set(), "Top level is not an object of country records"
+        if not production_data:
+            return production_file, None, set(), "File contains no country records"
+            
+        missing_keys = set()
+        for country, country_data in production_data.items():
+            if not isinstance(country_data, dict):
+                return production_file, None, set(), f"Record for {country} is not an object"
+            missing_keys |= expected_keys - country_data.keys()
+            
+        sample = next(iter(production_data.items()))
+        return production_file, sample, missing_keys, None
+
     def test_production_data_files(self) -> bool:
-        """Test production data files availability"""
+        """Test production data files availability and structure"""
         print("\n=== Testing Production Data Files ===")
         
         geo_dir = self.fao_data_dir / "geo"
-        if not geo_dir.exists():
+        if not self._exists(geo_dir):
             self.log_issue('ERROR', f"Production data directory not found: {geo_dir}")
             return False
             
-        production_files = list(geo_dir.glob("*_production_*.json"))
+        production_files = sorted(
+            geo_dir / name for name in self._dir_entries(geo_dir)
+            if fnmatch(name, "*_production_*.json")
+        )
         
         if not production_files:
             self.log_issue('ERROR', f"No production data files found in {geo_dir}")
@@ -398,28 +601,29 @@ class MetricsTestSuite:
             
         self.log_issue('INFO', f"✓ Found {len(production_files)} production data files")
         
-        # Test a sample file
-        sample_file = production_files[0]
-        try:
-            with open(sample_file, 'r') as f:
-                sample_data = json.load(f)
+        # Validate all files; reads and parsing release the GIL, so threads scale
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._validate_production_file, production_files))
+        
+        failures = []
+        for production_file, _, missing_keys, error in results:
+            if error:
+                failures.append(f"Failed to load {production_file.name}: {error}")
+            elif missing_keys:
+                failures.append(f"{production_file.name} missing keys: {missing_keys}")
                 
-            sample_country = next(iter(sample_data.keys()))
-            sample_country_data = sample_data[sample_country]
-            
-            expected_keys = {'value', 'unit', 'item', 'year', 'element'}
-            if set(sample_country_data.keys()) >= expected_keys:
-                self.log_issue('INFO', f"✓ Production file structure is correct")
-                self.log_issue('INFO', f"  Sample: {sample_country} - {sample_country_data}")
-            else:
-                missing_keys = expected_keys - set(sample_country_data.keys())
-                self.log_issue('ERROR', f"✗ Production file missing keys: {missing_keys}")
-                return False
-                
-        except Exception as e:
-            self.log_issue('ERROR', f"Failed to load sample production file: {e}")
+        if failures:
+            for failure in failures[:10]:  # Show first 10 failures
+                self.log_issue('ERROR', f"✗ Production file check failed: {failure}")
+            if len(failures) > 10:
+                self.log_issue('ERROR', f"✗ ... and {len(failures) - 10} more production files failed")
             return False
             
+        sample_country, sample_country_data = results[0][1]
+        self.log_issue('INFO', f"✓ Production file structure is correct in all {len(results)} files")
+        self.log_issue('INFO', lambda: f"  Sample: {sample_country} - {sample_country_data}")
+            
         return True
 
     def generate_report(self) -> Dict:
@@ -522,17 +726,20 @@ class MetricsTestSuite:
             print("❌ Critical: Cannot load timeseries data. Cannot continue tests.")
             return self.generate_report()
         
+        # Collect all aggregates in a single pass over the data
+        self._single_pass(timeseries_data)
+        
         # Test 3: Analyze available fields
-        available_fields = self.analyze_data_fields(timeseries_data)
+        available_fields = self.analyze_data_fields()
         
         # Test 4: Test metric availability
-        self.test_metric_data_availability(timeseries_data, available_fields)
+        self.test_metric_data_availability(available_fields)
         
         # Test 5: Test calculated metrics
-        self.test_metric_calculations(timeseries_data)
+        self.test_metric_calculations()
         
         # Test 6: Test data consistency
-        self.test_data_consistency(timeseries_data)
+        self.test_data_consistency()
         
         # Test 7: Test production data files
         self.test_production_data_files()
@@ -7,10 +7,26 @@ A simplified test to quickly verify that all expected metrics are working correc
 This test focuses on the most critical metrics and provides a quick pass/fail result.
 """
 
-import json
 import sys
+from itertools import chain, islice
 from pathlib import Path
 
+from _ts_loader import load_timeseries
+
+try:
+    import ijson
+except ImportError:  # Fall back to loading the whole file
+    ijson = None
+
+def iter_timeseries(timeseries_file):
+    """Yield timeseries entries lazily, so callers can stop after the first few"""
+    if ijson is None:
+        yield from load_timeseries(timeseries_file)
+        return
+    
+    with open(timeseries_file, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
 def test_metrics_availability():
     """Quick test to verify metric data availability"""
     project_root = Path(__file__).parent.parent
@@ -20,20 +36,26 @@ def test_metrics_availability():
         print("❌ FAIL: timeseries.json not found")
         return False
     
+    # Only the first entries are needed, so the file is parsed just as far as required
+    entries = iter_timeseries(timeseries_file)
     try:
-        with open(timeseries_file, 'r') as f:
-            data = json.load(f)
+        return check_entries(entries)
     except Exception as e:
         print(f"❌ FAIL: Could not load timeseries data: {e}")
         return False
+    finally:
+        entries.close()
+
+def check_entries(entries):
+    """Check core metric fields on the first entry and feed_percentage inputs on the first 10"""
+    sample_entry = next(entries, None)
     
     # Check basic structure
-    if not data or not isinstance(data, list):
+    if not isinstance(sample_entry, dict):
         print("❌ FAIL: Invalid timeseries data structure")
         return False
     
     # Get available fields from first entry
-    sample_entry = data[0]
     if 'data' not in sample_entry or not sample_entry['data']:
         print("❌ FAIL: No data in sample entry")
         return False
@@ -60,11 +82,10 @@ def test_metrics_availability():
     
     print("✅ PASS: All core metrics are available in the data")
     print(f"   Available fields: {sorted(available_fields)}")
-    print(f"   Data entries: {len(data)}")
     
     # Test calculated metrics (feed_percentage)
     has_calculation_data = False
-    for entry in data[:10]:
+    for entry in islice(chain([sample_entry], entries), 10):
         for year_data in entry.get('data', []):
             production = year_data.get('production')
             feed = year_data.get('feed')
@@ -80,7 +80,7 @@ if [ "$QUICK_TEST" = true ] && [ "$VIZ_TEST" = true ]; then
     
     echo ""
     echo "📖 For detailed analysis, run:"
-    echo "   python3 tests/comprehensive-metrics-test.py"
+    echo "   METRICS_TEST_VERBOSE=1 python3 tests/comprehensive-metrics-test.py"
     echo ""
     echo "📊 See METRICS_TEST_RESULTS.md for complete report"
     
@@ -102,7 +102,7 @@ else
     echo "   1. Check that data files exist in public/data/fao/"
     echo "   2. Verify timeseries.json is valid and contains data"
     echo "   3. Run comprehensive test for detailed analysis:"
-    echo "      python3 tests/comprehensive-metrics-test.py"
+    echo "      METRICS_TEST_VERBOSE=1 python3 tests/comprehensive-metrics-test.py"
     
     exit 1
 fi
\ No newline at end of file
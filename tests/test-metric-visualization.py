@@ -7,111 +7,134 @@ Tests that the available metrics can be properly used for visualization
 by simulating the data transformations that the Vue components would perform.
 """
 
-import json
 import sys
 from pathlib import Path
 from collections import defaultdict
+import numpy as np
+import pandas as pd
+
+from _ts_loader import load_timeseries
+
+def entry_rows(data, n_entries):
+    """Number of flattened year records that belong to the first n_entries entries"""
+    return sum(len(entry.get('data') or []) for entry in data[:n_entries])
 
 def load_test_data():
-    """Load sample data for testing"""
+    """Load sample data for testing (through the shared timeseries cache)"""
     project_root = Path(__file__).parent.parent
     timeseries_file = project_root / "public" / "data" / "fao" / "timeseries.json"
     
     try:
-        with open(timeseries_file, 'r') as f:
-            data = json.load(f)
-        return data
+        return load_timeseries(timeseries_file)
     except Exception as e:
         print(f"❌ Could not load test data: {e}")
         return None
 
-def test_metric_data_extraction(data, metric_field, test_name):
+def build_frame(entries, fields):
+    """Flatten the year records of timeseries entries into one DataFrame
+    
+    Returns (records, frame), where row i of the frame holds records[i]. Only year and the
+    given fields become columns, which spares pandas collecting the keys of every record;
+    fields missing from the data are all-NaN columns. Country and item are added per record
+    by repeating each entry's codes. The names repeat on every year record, so they are
+    stored as categoricals and comparisons and groupbys work on the integer codes.
+    """
+    entries = [entry for entry in entries if entry.get('data')]
+    records = [year_data for entry in entries for year_data in entry['data']]
+    lengths = [len(entry['data']) for entry in entries]
+    
+    frame = pd.DataFrame(records, columns=['year', *fields])
+    for column in ('country', 'item'):
+        names = pd.Categorical([entry.get(column) for entry in entries])
+        frame[column] = pd.Categorical.from_codes(np.repeat(names.codes, lengths), names.categories)
+    return records, frame
+
+def test_metric_data_extraction(frame, records, metric_field, test_name):
     """Test extracting data for a specific metric"""
     print(f"\n--- Testing {test_name} ({metric_field}) ---")
     
-    extracted_data = []
-    countries_with_data = set()
-    years_with_data = set()
+    if metric_field not in frame.columns:
+        print(f"❌ No usable data found for {metric_field}")
+        return False
     
-    for entry in data[:100]:  # Test first 100 entries
-        country = entry.get('country')
-        item = entry.get('item')
-        
-        for year_data in entry.get('data', []):
-            year = year_data.get('year')
-            value = year_data.get(metric_field)
-            
-            if value is not None and value != 0:  # Exclude null and zero values for this test
-                extracted_data.append({
-                    'country': country,
-                    'item': item,
-                    'year': year,
-                    'value': value
-                })
-                countries_with_data.add(country)
-                years_with_data.add(year)
-    
-    if extracted_data:
-        print(f"✅ Successfully extracted {len(extracted_data)} data points")
-        print(f"   Countries with data: {len(countries_with_data)}")
-        print(f"   Years with data: {sorted(years_with_data)}")
-        print(f"   Sample values: {[d['value'] for d in extracted_data[:5]]}")
-        return True
-    else:
+    values = frame[metric_field]
+    mask = values.notna() & (values != 0)  # Exclude null and zero values for this test
+    
+    # Only the count is needed to decide; the matching rows are never copied as a whole
+    count = int(mask.sum())
+    if count == 0:
         print(f"❌ No usable data found for {metric_field}")
         return False
+    
+    print(f"✅ Successfully extracted {count} data points")
+    print(f"   Countries with data: {frame['country'][mask].nunique(dropna=False)}")
+    print(f"   Years with data: {sorted(frame['year'][mask].unique().tolist())}")
+    # Samples come from the records, as the frame column has turned integers into floats
+    print(f"   Sample values: {[records[i][metric_field] for i in np.flatnonzero(mask.to_numpy())[:5]]}")
+    return True
 
-def test_calculated_metric(data):
+def feed_percentage(production, feed):
+    """feed / production * 100 where production > 0 and feed is present, NaN elsewhere"""
+    out = np.full(production.size, np.nan)
+    valid = (production > 0) & ~np.isnan(feed)
+    out[valid] = feed[valid] / production[valid] * 100
+    return out
+
+def test_calculated_metric(frame):
     """Test feed percentage calculation"""
     print(f"\n--- Testing Feed Percentage Calculation ---")
     
-    calculated_data = []
-    
-    for entry in data[:50]:  # Test first 50 entries
-        country = entry.get('country')
-        item = entry.get('item')
-        
-        for year_data in entry.get('data', []):
-            year = year_data.get('year')
-            production = year_data.get('production')
-            feed = year_data.get('feed')
-            
-            if production is not None and feed is not None and production > 0:
-                feed_percentage = (feed / production) * 100
-                calculated_data.append({
-                    'country': country,
-                    'item': item,
-                    'year': year,
-                    'production': production,
-                    'feed': feed,
-                    'feed_percentage': feed_percentage
-                })
-    
-    if calculated_data:
-        print(f"✅ Successfully calculated {len(calculated_data)} feed percentages")
-        for calc in calculated_data[:3]:
-            print(f"   {calc['country']} - {calc['item']} ({calc['year']}): {calc['feed_percentage']:.1f}%")
+    if {'production', 'feed'} <= set(frame.columns):
+        production = frame['production'].to_numpy(dtype=np.float64, na_value=np.nan)
+        feed = frame['feed'].to_numpy(dtype=np.float64, na_value=np.nan)
+        percentages = feed_percentage(production, feed)
+        calculated_idx = np.flatnonzero(~np.isnan(percentages))
+    else:
+        calculated_idx = np.empty(0, dtype=np.int64)
+    
+    if calculated_idx.size:
+        print(f"✅ Successfully calculated {calculated_idx.size} feed percentages")
+        for i in calculated_idx[:3]:
+            row = frame.iloc[i]
+            country, item = (None if pd.isna(row[column]) else row[column] for column in ('country', 'item'))
+            print(f"   {country} - {item} ({row['year']}): {percentages[i]:.1f}%")
         return True
     else:
         print(f"❌ Could not calculate feed percentages")
         return False
 
-def test_timeseries_aggregation(data):
-    """Test aggregating data for timeseries visualization"""
-    print(f"\n--- Testing Timeseries Aggregation ---")
+def aggregate_production(data, latest_year):
+    """Aggregate production for the timeseries and geographic tests in one pass over the data
     
-    # Aggregate global production by year
+    Returns (global production by year, production by country in latest_year). World totals
+    are excluded from both to avoid double counting; the per-country sums also skip long
+    regional aggregate names.
+    """
     global_production_by_year = defaultdict(float)
+    country_production = defaultdict(float)
     
     for entry in data:
         country = entry.get('country')
-        if country and 'world' not in country.lower():  # Exclude world totals to avoid double counting
-            for year_data in entry.get('data', []):
-                year = year_data.get('year')
-                production = year_data.get('production')
-                
-                if year and production is not None:
-                    global_production_by_year[year] += production
+        if not country or 'world' in country.lower():  # Exclude world totals to avoid double counting
+            continue
+        
+        is_country = len(country) < 50  # Exclude regional totals from the geographic view
+        for year_data in entry.get('data', []):
+            year = year_data.get('year')
+            production = year_data.get('production')
+            
+            if production is None:
+                continue
+            if year:
+                global_production_by_year[year] += production
+            if is_country and year == latest_year:
+                country_production[country] += production
+    
+    return global_production_by_year, country_production
+
+def test_timeseries_aggregation(global_production_by_year):
+    """Test aggregating data for timeseries visualization"""
+    print(f"\n--- Testing Timeseries Aggregation ---")
     
     if global_production_by_year:
         years = sorted(global_production_by_year.keys())
@@ -123,24 +146,10 @@ def test_timeseries_aggregation(data):
         print(f"❌ Could not aggregate timeseries data")
         return False
 
-def test_geographic_aggregation(data):
+def test_geographic_aggregation(country_production, latest_year):
     """Test aggregating data for geographic visualization"""
     print(f"\n--- Testing Geographic Aggregation ---")
     
-    # Aggregate production by country for latest year
-    latest_year = 2022
-    country_production = defaultdict(float)
-    
-    for entry in data:
-        country = entry.get('country')
-        if country and 'world' not in country.lower() and len(country) < 50:  # Exclude world/regional totals
-            for year_data in entry.get('data', []):
-                year = year_data.get('year')
-                production = year_data.get('production')
-                
-                if year == latest_year and production is not None:
-                    country_production[country] += production
-    
     if country_production:
         top_countries = sorted(country_production.items(), key=lambda x: x[1], reverse=True)[:5]
         print(f"✅ Successfully aggregated geographic data for {len(country_production)} countries")
@@ -177,23 +186,29 @@ def main():
         ('feed', 'Feed Usage')
     ]
     
+    # Extraction and calculation tests share one flattened frame of the first 100 entries
+    records, sample_frame = build_frame(data[:100], [metric_field for metric_field, _ in core_metrics])
+    
     for metric_field, test_name in core_metrics:
         total_tests += 1
-        if test_metric_data_extraction(data, metric_field, test_name):
+        if test_metric_data_extraction(sample_frame, records, metric_field, test_name):
             tests_passed += 1
     
     # Test calculated metrics
     total_tests += 1
-    if test_calculated_metric(data):
+    if test_calculated_metric(sample_frame.iloc[:entry_rows(data, 50)]):  # Test first 50 entries
         tests_passed += 1
     
-    # Test aggregations
+    # Test aggregations (both computed in a single pass)
+    latest_year = 2022
+    global_production_by_year, country_production = aggregate_production(data, latest_year)
+    
     total_tests += 1
-    if test_timeseries_aggregation(data):
+    if test_timeseries_aggregation(global_production_by_year):
         tests_passed += 1
     
     total_tests += 1
-    if test_geographic_aggregation(data):
+    if test_geographic_aggregation(country_production, latest_year):
         tests_passed += 1
     
     # Summary